@@ -2,7 +2,7 @@
 Database module for testing
 """
 
-from typing import Optional, List
+from typing import Optional, Dict
 from .utils import generate_id
 
 
@@ -14,16 +14,14 @@ class User:
         self.password_hash = password_hash
 
 
-# In-memory storage
-_users: List[User] = []
+# In-memory storage, indexed by id and email
+_users_by_id: Dict[str, User] = {}
+_users_by_email: Dict[str, User] = {}
 
 
 def find_user_by_email(email: str) -> Optional[User]:
     """Find a user by email"""
-    for user in _users:
-        if user.email == email:
-            return user
-    return None
+    return _users_by_email.get(email)
 
 
 def create_user(email: str, password_hash: str) -> User:
@@ -33,15 +31,21 @@ def create_user(email: str, password_hash: str) -> User:
         email=email,
         password_hash=password_hash
     )
-    _users.append(user)
+    _users_by_id[user.id] = user
+    _users_by_email.setdefault(email, user)  # Lookups return the first user with an email
     return user
 
 
 def delete_user(user_id: str) -> bool:
     """Delete a user by ID"""
-    global _users
-    for i, user in enumerate(_users):
-        if user.id == user_id:
-            _users.pop(i)
-            return True
-    return False
+    user = _users_by_id.pop(user_id, None)
+    if not user:
+        return False
+    if _users_by_email.get(user.email) is user:
+        del _users_by_email[user.email]
+        # Fall back to the next-oldest user with the same email, if any
+        for other in _users_by_id.values():
+            if other.email == user.email:
+                _users_by_email[user.email] = other
+                break
+    return True
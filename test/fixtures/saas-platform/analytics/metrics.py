@@ -4,8 +4,9 @@ Records usage data, events, and business metrics.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from collections import defaultdict
+import bisect
 
 
 # Metrics storage (in production, use time-series DB)
@@ -13,6 +14,28 @@ _events: List[Dict[str, Any]] = []
 _counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
 _gauges: Dict[str, Dict[str, float]] = defaultdict(dict)
 
+# Per-team event index: parallel lists of events and their epoch-microsecond
+# timestamps, both in append (chronological) order so `since` is a bisect
+_events_by_team: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+_ts_by_team: Dict[str, List[int]] = defaultdict(list)
+_event_counts: Dict[Tuple[str, str], int] = defaultdict(int)
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_us(dt: datetime) -> int:
+    """Convert a naive UTC datetime to integer microseconds since the epoch."""
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def _team_window(team_id: str, since: Optional[datetime]) -> Tuple[List[Dict[str, Any]], int]:
+    """Return a team's events and the index of the first one at or after since."""
+    events = _events_by_team.get(team_id, [])
+    if not since:
+        return events, 0
+    return events, bisect.bisect_left(_ts_by_team.get(team_id, []), _to_epoch_us(since))
+
 
 def track_event(
     event_name: str,
@@ -21,15 +44,19 @@ def track_event(
     properties: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Track a user/system event for analytics."""
+    now = datetime.utcnow()
     event = {
         "name": event_name,
         "team_id": team_id,
         "user_id": user_id,
         "properties": properties or {},
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now.isoformat(),
     }
 
     _events.append(event)
+    _events_by_team[team_id].append(event)
+    _ts_by_team[team_id].append(_to_epoch_us(now))
+    _event_counts[(team_id, event_name)] += 1
     return event
 
 
@@ -58,20 +85,19 @@ def get_events(
     team_id: str,
     event_name: Optional[str] = None,
     since: Optional[datetime] = None,
-    limit: int = 100
+    limit: int = 100,
+    user_id: Optional[str] = None
 ) -> List[Dict[str, Any]]:
     """Query events with optional filtering."""
+    events, start = _team_window(team_id, since)
     filtered = []
 
-    for event in reversed(_events):  # Most recent first
-        if event["team_id"] != team_id:
-            continue
+    for i in range(len(events) - 1, start - 1, -1):  # Most recent first
+        event = events[i]
         if event_name and event["name"] != event_name:
             continue
-        if since:
-            event_time = datetime.fromisoformat(event["timestamp"])
-            if event_time < since:
-                continue
+        if user_id and event.get("user_id") != user_id:
+            continue
 
         filtered.append(event)
         if len(filtered) >= limit:
@@ -86,34 +112,27 @@ def count_events(
     since: Optional[datetime] = None
 ) -> int:
     """Count occurrences of an event type."""
+    if not since:
+        return _event_counts.get((team_id, event_name), 0)
+
+    events, start = _team_window(team_id, since)
     count = 0
-    for event in _events:
-        if event["team_id"] != team_id:
-            continue
-        if event["name"] != event_name:
-            continue
-        if since:
-            event_time = datetime.fromisoformat(event["timestamp"])
-            if event_time < since:
-                continue
-        count += 1
+    for i in range(start, len(events)):
+        if events[i]["name"] == event_name:
+            count += 1
     return count
 
 
 def get_daily_active_users(team_id: str) -> int:
     """Calculate unique users active in the last 24 hours."""
     since = datetime.utcnow() - timedelta(hours=24)
+    events, start = _team_window(team_id, since)
     user_ids = set()
 
-    for event in _events:
-        if event["team_id"] != team_id:
-            continue
-        if not event.get("user_id"):
-            continue
-
-        event_time = datetime.fromisoformat(event["timestamp"])
-        if event_time >= since:
-            user_ids.add(event["user_id"])
+    for i in range(start, len(events)):
+        user_id = events[i].get("user_id")
+        if user_id:
+            user_ids.add(user_id)
 
     return len(user_ids)
 
@@ -123,27 +142,31 @@ def calculate_retention(team_id: str, cohort_date: datetime, days: int = 7) -> f
     Calculate retention rate for users who signed up on cohort_date.
     Returns percentage of users active within the given days.
     """
-    cohort_end = cohort_date + timedelta(days=1)
-    retention_end = cohort_date + timedelta(days=days)
+    cohort_end_us = _to_epoch_us(cohort_date + timedelta(days=1))
+    retention_end_us = _to_epoch_us(cohort_date + timedelta(days=days))
+
+    events, start = _team_window(team_id, cohort_date)
+    timestamps = _ts_by_team.get(team_id, [])
 
     # Find users in cohort (signed up on that day)
     cohort_users = set()
     retained_users = set()
 
-    for event in _events:
-        if event["team_id"] != team_id:
-            continue
+    for i in range(start, len(events)):
+        event_time = timestamps[i]
+        if event_time > retention_end_us:
+            break
+
+        event = events[i]
         if not event.get("user_id"):
             continue
 
-        event_time = datetime.fromisoformat(event["timestamp"])
-
         # User in signup cohort
-        if event["name"] == "user.signup" and cohort_date <= event_time < cohort_end:
+        if event["name"] == "user.signup" and event_time < cohort_end_us:
             cohort_users.add(event["user_id"])
 
         # User active in retention window
-        if cohort_end <= event_time <= retention_end:
+        if event_time >= cohort_end_us:
             retained_users.add(event["user_id"])
 
     if not cohort_users:
@@ -5,8 +5,8 @@ Builds dashboards, exports, and scheduled reports.
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
-import uuid
 
+from ..utils import uuid4_str
 from .metrics import (
     get_events,
     count_events,
@@ -44,10 +44,7 @@ def generate_usage_report(team_id: str, days: int = 30) -> Dict[str, Any]:
 def generate_activity_summary(team_id: str, user_id: Optional[str] = None) -> Dict[str, Any]:
     """Generate activity summary for a team or specific user."""
     since = datetime.utcnow() - timedelta(days=7)
-    events = get_events(team_id, since=since, limit=1000)
-
-    if user_id:
-        events = [e for e in events if e.get("user_id") == user_id]
+    events = get_events(team_id, since=since, limit=1000, user_id=user_id)
 
     # Group by event type
     by_type: Dict[str, int] = {}
@@ -93,7 +90,7 @@ def export_report_csv(report: Dict[str, Any]) -> str:
 def save_report(team_id: str, report: Dict[str, Any], name: str) -> Dict[str, Any]:
     """Save a generated report for later access."""
     saved = {
-        "id": str(uuid.uuid4()),
+        "id": uuid4_str(),
         "team_id": team_id,
         "name": name,
         "report": report,
@@ -120,7 +117,7 @@ def schedule_report(
 ) -> Dict[str, Any]:
     """Schedule a recurring report."""
     scheduled = {
-        "id": str(uuid.uuid4()),
+        "id": uuid4_str(),
         "team_id": team_id,
         "report_type": report_type,
         "schedule": schedule,
@@ -4,27 +4,31 @@ Handles user login, token management, and session validation.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set
 import hashlib
+import hmac
 import secrets
 
 # In-memory session store (would be Redis in production)
 _sessions: Dict[str, Dict[str, Any]] = {}
+_sessions_by_user: Dict[str, Set[str]] = {}  # user_id -> session tokens
 _failed_attempts: Dict[str, int] = {}
 
 MAX_FAILED_ATTEMPTS = 5
 SESSION_DURATION_HOURS = 24
+PASSWORD_HASH_ITERATIONS = 100_000
 
 
 def hash_password(password: str, salt: str) -> str:
-    """Hash a password with the given salt using SHA-256."""
-    combined = f"{salt}:{password}"
-    return hashlib.sha256(combined.encode()).hexdigest()
+    """Hash a password with the given salt using PBKDF2-HMAC-SHA256."""
+    return hashlib.pbkdf2_hmac(
+        "sha256", password.encode(), salt.encode(), PASSWORD_HASH_ITERATIONS
+    ).hex()
 
 
 def verify_password(password: str, salt: str, password_hash: str) -> bool:
-    """Verify a password matches the stored hash."""
-    return hash_password(password, salt) == password_hash
+    """Verify a password matches the stored hash in constant time."""
+    return hmac.compare_digest(hash_password(password, salt), password_hash)
 
 
 def generate_session_token() -> str:
@@ -65,6 +69,7 @@ def create_session(user_id: str, metadata: Optional[Dict[str, Any]] = None) -> s
         "expires_at": expires_at.isoformat(),
         "metadata": metadata or {},
     }
+    _sessions_by_user.setdefault(user_id, set()).add(token)
 
     return token
 
@@ -88,18 +93,21 @@ def validate_session(token: str) -> Optional[Dict[str, Any]]:
 
 def invalidate_session(token: str) -> bool:
     """Invalidate a session token (logout)."""
-    if token in _sessions:
-        del _sessions[token]
-        return True
-    return False
+    session = _sessions.pop(token, None)
+    if not session:
+        return False
+
+    user_tokens = _sessions_by_user.get(session["user_id"])
+    if user_tokens:
+        user_tokens.discard(token)
+        if not user_tokens:
+            del _sessions_by_user[session["user_id"]]
+    return True
 
 
 def invalidate_all_user_sessions(user_id: str) -> int:
     """Invalidate all sessions for a user. Returns count of invalidated sessions."""
-    tokens_to_remove = [
-        token for token, session in _sessions.items()
-        if session["user_id"] == user_id
-    ]
+    tokens_to_remove = _sessions_by_user.pop(user_id, set())
     for token in tokens_to_remove:
-        del _sessions[token]
+        _sessions.pop(token, None)
     return len(tokens_to_remove)
@@ -3,7 +3,7 @@ Permission and role-based access control for SaaS platform.
 Manages user roles, permissions, and authorization checks.
 """
 
-from typing import Set, Dict, List, Optional
+from typing import Dict, List, Optional, FrozenSet, Tuple
 from enum import Enum
 
 
@@ -27,32 +27,36 @@ class Role(Enum):
     OWNER = "owner"
 
 
-# Role to permissions mapping
-ROLE_PERMISSIONS: Dict[Role, Set[Permission]] = {
-    Role.VIEWER: {Permission.READ_PROJECTS, Permission.VIEW_ANALYTICS},
-    Role.MEMBER: {
+# Role to permissions mapping (frozen so lookups can be shared without copying)
+ROLE_PERMISSIONS: Dict[Role, FrozenSet[Permission]] = {
+    Role.VIEWER: frozenset({Permission.READ_PROJECTS, Permission.VIEW_ANALYTICS}),
+    Role.MEMBER: frozenset({
         Permission.READ_PROJECTS,
         Permission.WRITE_PROJECTS,
         Permission.VIEW_ANALYTICS,
-    },
-    Role.ADMIN: {
+    }),
+    Role.ADMIN: frozenset({
         Permission.READ_PROJECTS,
         Permission.WRITE_PROJECTS,
         Permission.DELETE_PROJECTS,
         Permission.MANAGE_TEAM,
         Permission.VIEW_BILLING,
         Permission.VIEW_ANALYTICS,
-    },
-    Role.OWNER: set(Permission),  # All permissions
+    }),
+    Role.OWNER: frozenset(Permission),  # All permissions
 }
 
 # User role assignments (user_id -> team_id -> role)
 _user_roles: Dict[str, Dict[str, Role]] = {}
 
+# Flattened (user_id, team_id) -> permissions, kept in sync by assign/revoke
+_user_perm_cache: Dict[Tuple[str, str], FrozenSet[Permission]] = {}
+_EMPTY_PERMISSIONS: FrozenSet[Permission] = frozenset()
 
-def get_role_permissions(role: Role) -> Set[Permission]:
+
+def get_role_permissions(role: Role) -> FrozenSet[Permission]:
     """Get all permissions associated with a role."""
-    return ROLE_PERMISSIONS.get(role, set())
+    return ROLE_PERMISSIONS.get(role, _EMPTY_PERMISSIONS)
 
 
 def assign_role(user_id: str, team_id: str, role: Role) -> None:
@@ -60,12 +64,14 @@ def assign_role(user_id: str, team_id: str, role: Role) -> None:
     if user_id not in _user_roles:
         _user_roles[user_id] = {}
     _user_roles[user_id][team_id] = role
+    _user_perm_cache[(user_id, team_id)] = get_role_permissions(role)
 
 
 def revoke_role(user_id: str, team_id: str) -> bool:
     """Revoke a user's role in a team."""
     if user_id in _user_roles and team_id in _user_roles[user_id]:
         del _user_roles[user_id][team_id]
+        _user_perm_cache.pop((user_id, team_id), None)
         return True
     return False
 
@@ -75,18 +81,17 @@ def get_user_role(user_id: str, team_id: str) -> Optional[Role]:
     return _user_roles.get(user_id, {}).get(team_id)
 
 
-def get_user_permissions(user_id: str, team_id: str) -> Set[Permission]:
+def get_user_permissions(user_id: str, team_id: str) -> FrozenSet[Permission]:
     """Get all permissions a user has in a team."""
     role = get_user_role(user_id, team_id)
     if not role:
-        return set()
+        return _EMPTY_PERMISSIONS
     return get_role_permissions(role)
 
 
 def has_permission(user_id: str, team_id: str, permission: Permission) -> bool:
     """Check if a user has a specific permission in a team."""
-    permissions = get_user_permissions(user_id, team_id)
-    return permission in permissions
+    return permission in _user_perm_cache.get((user_id, team_id), _EMPTY_PERMISSIONS)
 
 
 def check_permission(user_id: str, team_id: str, permission: Permission) -> None:
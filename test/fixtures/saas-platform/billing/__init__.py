@@ -22,6 +22,7 @@ from .payments import (
     get_invoice,
     get_team_invoices,
     process_payment,
+    process_payments_batch,
     refund_payment,
     get_transaction_history,
 )
@@ -4,9 +4,11 @@ Handles invoices, payment methods, and transaction processing.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
-import uuid
+
+from ..models import Invoice, Transaction
+from ..utils import now_iso, uuid4_str
 
 
 class PaymentStatus(Enum):
@@ -25,9 +27,12 @@ class PaymentMethod(Enum):
 
 
 # Storage
-_payment_methods: Dict[str, List[Dict[str, Any]]] = {}
-_invoices: Dict[str, Dict[str, Any]] = {}
-_transactions: Dict[str, Dict[str, Any]] = {}
+_payment_methods: Dict[str, Dict[str, Dict[str, Any]]] = {}  # team_id -> {method_id: method}
+_default_payment_methods: Dict[str, Dict[str, Any]] = {}  # team_id -> default method
+_invoices: Dict[str, Invoice] = {}
+_transactions: Dict[str, Transaction] = {}
+_invoices_by_team: Dict[str, List[str]] = {}  # team_id -> invoice ids
+_transactions_by_team: Dict[str, List[str]] = {}  # team_id -> transaction ids
 
 
 def add_payment_method(
@@ -38,48 +43,46 @@ def add_payment_method(
 ) -> Dict[str, Any]:
     """Add a payment method for a team."""
     method = {
-        "id": str(uuid.uuid4()),
+        "id": uuid4_str(),
         "team_id": team_id,
         "type": method_type.value,
         "last_four": details.get("last_four", "****"),
         "is_default": is_default,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": now_iso(),
     }
 
-    if team_id not in _payment_methods:
-        _payment_methods[team_id] = []
-
-    # If this is default, unset other defaults
+    # If this is default, unset the previous default
     if is_default:
-        for existing in _payment_methods[team_id]:
-            existing["is_default"] = False
+        previous = _default_payment_methods.get(team_id)
+        if previous:
+            previous["is_default"] = False
+        _default_payment_methods[team_id] = method
 
-    _payment_methods[team_id].append(method)
+    _payment_methods.setdefault(team_id, {})[method["id"]] = method
     return method
 
 
 def get_payment_methods(team_id: str) -> List[Dict[str, Any]]:
     """Get all payment methods for a team."""
-    return _payment_methods.get(team_id, [])
+    return list(_payment_methods.get(team_id, {}).values())
 
 
 def get_default_payment_method(team_id: str) -> Optional[Dict[str, Any]]:
     """Get the default payment method for a team."""
-    methods = get_payment_methods(team_id)
-    for method in methods:
-        if method["is_default"]:
-            return method
-    return methods[0] if methods else None
+    default = _default_payment_methods.get(team_id)
+    if default:
+        return default
+    return next(iter(_payment_methods.get(team_id, {}).values()), None)
 
 
 def remove_payment_method(team_id: str, method_id: str) -> bool:
     """Remove a payment method."""
-    methods = _payment_methods.get(team_id, [])
-    for i, method in enumerate(methods):
-        if method["id"] == method_id:
-            methods.pop(i)
-            return True
-    return False
+    method = _payment_methods.get(team_id, {}).pop(method_id, None)
+    if not method:
+        return False
+    if _default_payment_methods.get(team_id) is method:
+        del _default_payment_methods[team_id]
+    return True
 
 
 def create_invoice(
@@ -87,39 +90,37 @@ def create_invoice(
     amount_cents: int,
     description: str,
     line_items: List[Dict[str, Any]]
-) -> Dict[str, Any]:
+) -> Invoice:
     """Create an invoice for a team."""
-    invoice = {
-        "id": str(uuid.uuid4()),
-        "team_id": team_id,
-        "amount_cents": amount_cents,
-        "description": description,
-        "line_items": line_items,
-        "status": "open",
-        "created_at": datetime.utcnow().isoformat(),
-        "due_date": None,
-        "paid_at": None,
-    }
-
-    _invoices[invoice["id"]] = invoice
+    invoice = Invoice(
+        id=uuid4_str(),
+        team_id=team_id,
+        amount_cents=amount_cents,
+        description=description,
+        line_items=line_items,
+        created_at=now_iso(),
+    )
+
+    _invoices[invoice.id] = invoice
+    _invoices_by_team.setdefault(team_id, []).append(invoice.id)
     return invoice
 
 
-def get_invoice(invoice_id: str) -> Optional[Dict[str, Any]]:
+def get_invoice(invoice_id: str) -> Optional[Invoice]:
     """Get an invoice by ID."""
     return _invoices.get(invoice_id)
 
 
-def get_team_invoices(team_id: str) -> List[Dict[str, Any]]:
+def get_team_invoices(team_id: str) -> List[Invoice]:
     """Get all invoices for a team."""
-    return [inv for inv in _invoices.values() if inv["team_id"] == team_id]
+    return [_invoices[i] for i in _invoices_by_team.get(team_id, ())]
 
 
 def process_payment(
     team_id: str,
     amount_cents: int,
     invoice_id: Optional[str] = None
-) -> Dict[str, Any]:
+) -> Transaction:
     """
     Process a payment for a team.
     Uses the default payment method.
@@ -129,50 +130,89 @@ def process_payment(
         raise ValueError(f"No payment method on file for team {team_id}")
 
     # Simulate payment processing
-    transaction = {
-        "id": str(uuid.uuid4()),
-        "team_id": team_id,
-        "amount_cents": amount_cents,
-        "payment_method_id": payment_method["id"],
-        "invoice_id": invoice_id,
-        "status": PaymentStatus.SUCCEEDED.value,
-        "processed_at": datetime.utcnow().isoformat(),
-    }
-
-    _transactions[transaction["id"]] = transaction
+    transaction = Transaction(
+        id=uuid4_str(),
+        team_id=team_id,
+        amount_cents=amount_cents,
+        payment_method_id=payment_method["id"],
+        invoice_id=invoice_id,
+        status=PaymentStatus.SUCCEEDED.value,
+        processed_at=datetime.utcnow().isoformat(),
+    )
+
+    _transactions[transaction.id] = transaction
+    _transactions_by_team.setdefault(team_id, []).append(transaction.id)
 
     # Mark invoice as paid if provided
-    if invoice_id and invoice_id in _invoices:
-        _invoices[invoice_id]["status"] = "paid"
-        _invoices[invoice_id]["paid_at"] = transaction["processed_at"]
+    invoice = _invoices.get(invoice_id) if invoice_id else None
+    if invoice:
+        invoice.status = "paid"
+        invoice.paid_at = transaction.processed_at
 
     return transaction
 
 
-def refund_payment(transaction_id: str, reason: str) -> Dict[str, Any]:
+def process_payments_batch(
+    team_id: str,
+    items: List[Tuple[int, Optional[str]]]
+) -> List[Transaction]:
+    """
+    Process several (amount_cents, invoice_id) payments for a team at once.
+    Looks up the default payment method and timestamp once for the batch.
+    """
+    payment_method = get_default_payment_method(team_id)
+    if not payment_method:
+        raise ValueError(f"No payment method on file for team {team_id}")
+
+    method_id = payment_method["id"]
+    processed_at = datetime.utcnow().isoformat()
+    succeeded = PaymentStatus.SUCCEEDED.value
+    team_transaction_ids = _transactions_by_team.setdefault(team_id, [])
+    transactions = []
+
+    for amount_cents, invoice_id in items:
+        transaction = Transaction(
+            id=uuid4_str(),
+            team_id=team_id,
+            amount_cents=amount_cents,
+            payment_method_id=method_id,
+            invoice_id=invoice_id,
+            status=succeeded,
+            processed_at=processed_at,
+        )
+        _transactions[transaction.id] = transaction
+        team_transaction_ids.append(transaction.id)
+        transactions.append(transaction)
+
+        invoice = _invoices.get(invoice_id) if invoice_id else None
+        if invoice:
+            invoice.status = "paid"
+            invoice.paid_at = processed_at
+
+    return transactions
+
+
+def refund_payment(transaction_id: str, reason: str) -> Transaction:
     """Process a refund for a previous transaction."""
     transaction = _transactions.get(transaction_id)
     if not transaction:
         raise ValueError(f"Transaction {transaction_id} not found")
 
-    if transaction["status"] == PaymentStatus.REFUNDED.value:
+    if transaction.status == PaymentStatus.REFUNDED.value:
         raise ValueError("Transaction already refunded")
 
-    transaction["status"] = PaymentStatus.REFUNDED.value
-    transaction["refunded_at"] = datetime.utcnow().isoformat()
-    transaction["refund_reason"] = reason
+    transaction.status = PaymentStatus.REFUNDED.value
+    transaction.refunded_at = now_iso()
+    transaction.refund_reason = reason
 
     return transaction
 
 
-def get_transaction_history(team_id: str, limit: int = 50) -> List[Dict[str, Any]]:
+def get_transaction_history(team_id: str, limit: int = 50) -> List[Transaction]:
     """Get recent transactions for a team."""
-    team_transactions = [
-        t for t in _transactions.values()
-        if t["team_id"] == team_id
-    ]
+    team_transactions = [_transactions[t] for t in _transactions_by_team.get(team_id, ())]
     return sorted(
         team_transactions,
-        key=lambda t: t["processed_at"],
+        key=lambda t: t.processed_at,
         reverse=True
     )[:limit]
@@ -6,7 +6,9 @@ Handles plan selection, upgrades, downgrades, and subscription lifecycle.
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from enum import Enum
-import uuid
+import functools
+
+from ..utils import now_iso, uuid4_str
 
 
 class PlanTier(Enum):
@@ -31,32 +33,38 @@ PLAN_CONFIGS: Dict[PlanTier, Dict[str, Any]] = {
         "price_monthly": 0,
         "max_users": 3,
         "max_projects": 5,
-        "features": ["basic_analytics"],
+        "features": frozenset({"basic_analytics"}),
     },
     PlanTier.STARTER: {
         "price_monthly": 29,
         "max_users": 10,
         "max_projects": 25,
-        "features": ["basic_analytics", "api_access"],
+        "features": frozenset({"basic_analytics", "api_access"}),
     },
     PlanTier.PROFESSIONAL: {
         "price_monthly": 99,
         "max_users": 50,
         "max_projects": 100,
-        "features": ["advanced_analytics", "api_access", "priority_support"],
+        "features": frozenset({"advanced_analytics", "api_access", "priority_support"}),
     },
     PlanTier.ENTERPRISE: {
         "price_monthly": 299,
         "max_users": -1,  # Unlimited
         "max_projects": -1,
-        "features": ["advanced_analytics", "api_access", "priority_support", "sso", "audit_logs"],
+        "features": frozenset({"advanced_analytics", "api_access", "priority_support", "sso", "audit_logs"}),
     },
 }
 
+# Tier value -> enum, so stored tier strings skip PlanTier(...) validation
+_tier_by_value: Dict[str, PlanTier] = {t.value: t for t in PlanTier}
+
 # Active subscriptions (team_id -> subscription)
 _subscriptions: Dict[str, Dict[str, Any]] = {}
+# Resolved plan config per team, refreshed whenever a team's tier changes
+_plan_config_by_team: Dict[str, Dict[str, Any]] = {}
 
 
+@functools.lru_cache(maxsize=None)
 def get_plan_config(tier: PlanTier) -> Dict[str, Any]:
     """Get configuration for a subscription tier."""
     return PLAN_CONFIGS.get(tier, PLAN_CONFIGS[PlanTier.FREE])
@@ -72,7 +80,7 @@ def create_subscription(
     status = SubscriptionStatus.TRIALING if trial_days > 0 else SubscriptionStatus.ACTIVE
 
     subscription = {
-        "id": str(uuid.uuid4()),
+        "id": uuid4_str(),
         "team_id": team_id,
         "tier": tier.value,
         "status": status.value,
@@ -83,6 +91,7 @@ def create_subscription(
     }
 
     _subscriptions[team_id] = subscription
+    _plan_config_by_team[team_id] = get_plan_config(tier)
     return subscription
 
 
@@ -100,12 +109,13 @@ def upgrade_subscription(team_id: str, new_tier: PlanTier) -> Dict[str, Any]:
     if not subscription:
         raise ValueError(f"No subscription found for team {team_id}")
 
-    current_tier = PlanTier(subscription["tier"])
+    current_tier = _tier_by_value[subscription["tier"]]
     if PLAN_CONFIGS[new_tier]["price_monthly"] <= PLAN_CONFIGS[current_tier]["price_monthly"]:
         raise ValueError("Can only upgrade to a higher tier")
 
     subscription["tier"] = new_tier.value
-    subscription["upgraded_at"] = datetime.utcnow().isoformat()
+    _plan_config_by_team[team_id] = get_plan_config(new_tier)
+    subscription["upgraded_at"] = now_iso()
 
     return subscription
 
@@ -138,7 +148,7 @@ def cancel_subscription(team_id: str, immediate: bool = False) -> Dict[str, Any]
 
     if immediate:
         subscription["status"] = SubscriptionStatus.CANCELED.value
-        subscription["canceled_at"] = datetime.utcnow().isoformat()
+        subscription["canceled_at"] = now_iso()
     else:
         subscription["cancel_at_period_end"] = True
 
@@ -151,9 +161,8 @@ def check_feature_access(team_id: str, feature: str) -> bool:
     if not subscription or subscription["status"] == SubscriptionStatus.CANCELED.value:
         return False
 
-    tier = PlanTier(subscription["tier"])
-    config = get_plan_config(tier)
-    return feature in config.get("features", [])
+    config = _plan_config_by_team[team_id]
+    return feature in config.get("features", ())
 
 
 def check_usage_limit(team_id: str, resource: str, current_usage: int) -> bool:
@@ -162,8 +171,7 @@ def check_usage_limit(team_id: str, resource: str, current_usage: int) -> bool:
     if not subscription:
         return False
 
-    tier = PlanTier(subscription["tier"])
-    config = get_plan_config(tier)
+    config = _plan_config_by_team[team_id]
 
     limit_key = f"max_{resource}"
     limit = config.get(limit_key, 0)
@@ -6,7 +6,9 @@ Handles project CRUD, status tracking, and project settings.
 from datetime import datetime
 from typing import Dict, Optional, Any, List
 from enum import Enum
-import uuid
+
+from ..models import Project, field_names
+from ..utils import now_iso, SearchIndex, uuid4_str
 
 
 class ProjectStatus(Enum):
@@ -18,7 +20,22 @@ class ProjectStatus(Enum):
 
 
 # Storage
-_projects: Dict[str, Dict[str, Any]] = {}
+_projects: Dict[str, Project] = {}
+_project_search_index = SearchIndex()  # name + description
+
+_active_project_count: Dict[str, int] = {}  # team_id -> non-archived projects
+
+_PROJECT_FIELDS = field_names(Project)
+
+
+def _apply_status(project: Project, status: str) -> None:
+    """Set a project's status, keeping the team's active project count in sync."""
+    was_active = project.status != ProjectStatus.ARCHIVED.value
+    is_active = status != ProjectStatus.ARCHIVED.value
+    if was_active != is_active:
+        delta = 1 if is_active else -1
+        _active_project_count[project.team_id] = _active_project_count.get(project.team_id, 0) + delta
+    project.status = status
 
 
 def create_project(
@@ -26,55 +43,64 @@ def create_project(
     name: str,
     description: Optional[str] = None,
     created_by: Optional[str] = None
-) -> Dict[str, Any]:
+) -> Project:
     """Create a new project within a team."""
-    project_id = str(uuid.uuid4())
-
-    project = {
-        "id": project_id,
-        "team_id": team_id,
-        "name": name,
-        "description": description,
-        "status": ProjectStatus.ACTIVE.value,
-        "created_by": created_by,
-        "created_at": datetime.utcnow().isoformat(),
-        "settings": {},
-        "metadata": {},
-    }
+    project_id = uuid4_str()
+
+    project = Project(
+        id=project_id,
+        team_id=team_id,
+        name=name,
+        description=description,
+        status=ProjectStatus.ACTIVE.value,
+        created_by=created_by,
+        created_at=datetime.utcnow().isoformat(),
+    )
 
     _projects[project_id] = project
+    _project_search_index.set(project_id, name, description)
+    _active_project_count[team_id] = _active_project_count.get(team_id, 0) + 1
     return project
 
 
-def get_project(project_id: str) -> Optional[Dict[str, Any]]:
+def get_project(project_id: str) -> Optional[Project]:
     """Get a project by ID."""
     return _projects.get(project_id)
 
 
-def get_team_projects(team_id: str, include_archived: bool = False) -> List[Dict[str, Any]]:
+def get_team_projects(team_id: str, include_archived: bool = False) -> List[Project]:
     """Get all projects for a team."""
     projects = []
     for project in _projects.values():
-        if project["team_id"] != team_id:
+        if project.team_id != team_id:
             continue
-        if not include_archived and project["status"] == ProjectStatus.ARCHIVED.value:
+        if not include_archived and project.status == ProjectStatus.ARCHIVED.value:
             continue
         projects.append(project)
 
-    return sorted(projects, key=lambda p: p["created_at"], reverse=True)
+    return sorted(projects, key=lambda p: p.created_at, reverse=True)
 
 
-def update_project(project_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def update_project(project_id: str, updates: Dict[str, Any]) -> Optional[Project]:
     """Update project details."""
     project = _projects.get(project_id)
     if not project:
         return None
 
     forbidden = {"id", "team_id", "created_by", "created_at"}
-    safe_updates = {k: v for k, v in updates.items() if k not in forbidden}
+    safe_updates = {
+        k: v for k, v in updates.items()
+        if k in _PROJECT_FIELDS and k not in forbidden
+    }
 
-    project.update(safe_updates)
-    project["updated_at"] = datetime.utcnow().isoformat()
+    for key, value in safe_updates.items():
+        if key == "status":
+            _apply_status(project, value)
+        else:
+            setattr(project, key, value)
+    project.updated_at = now_iso()
+    if "name" in safe_updates or "description" in safe_updates:
+        _project_search_index.set(project_id, project.name, project.description)
 
     return project
 
@@ -85,8 +111,8 @@ def archive_project(project_id: str) -> bool:
     if not project:
         return False
 
-    project["status"] = ProjectStatus.ARCHIVED.value
-    project["archived_at"] = datetime.utcnow().isoformat()
+    _apply_status(project, ProjectStatus.ARCHIVED.value)
+    project.archived_at = now_iso()
     return True
 
 
@@ -96,57 +122,52 @@ def restore_project(project_id: str) -> bool:
     if not project:
         return False
 
-    if project["status"] != ProjectStatus.ARCHIVED.value:
+    if project.status != ProjectStatus.ARCHIVED.value:
         return False
 
-    project["status"] = ProjectStatus.ACTIVE.value
-    project["restored_at"] = datetime.utcnow().isoformat()
+    _apply_status(project, ProjectStatus.ACTIVE.value)
+    project.restored_at = now_iso()
     return True
 
 
 def delete_project(project_id: str) -> bool:
     """Permanently delete a project."""
-    if project_id in _projects:
-        del _projects[project_id]
-        return True
-    return False
+    project = _projects.pop(project_id, None)
+    if not project:
+        return False
+
+    if project.status != ProjectStatus.ARCHIVED.value:
+        _active_project_count[project.team_id] -= 1
+    _project_search_index.remove(project_id)
+    return True
 
 
-def set_project_status(project_id: str, status: ProjectStatus) -> Optional[Dict[str, Any]]:
+def set_project_status(project_id: str, status: ProjectStatus) -> Optional[Project]:
     """Update project status."""
     project = _projects.get(project_id)
     if not project:
         return None
 
-    project["status"] = status.value
-    project["status_changed_at"] = datetime.utcnow().isoformat()
+    _apply_status(project, status.value)
+    project.status_changed_at = now_iso()
     return project
 
 
-def search_projects(team_id: str, query: str) -> List[Dict[str, Any]]:
+def search_projects(team_id: str, query: str) -> List[Project]:
     """Search projects by name or description within a team."""
-    query_lower = query.lower()
     matches = []
 
-    for project in _projects.values():
-        if project["team_id"] != team_id:
+    for project_id in _project_search_index.search(query):
+        project = _projects[project_id]
+        if project.team_id != team_id:
             continue
-        if project["status"] == ProjectStatus.ARCHIVED.value:
+        if project.status == ProjectStatus.ARCHIVED.value:
             continue
-
-        name_match = query_lower in project["name"].lower()
-        desc_match = project.get("description") and query_lower in project["description"].lower()
-
-        if name_match or desc_match:
-            matches.append(project)
+        matches.append(project)
 
     return matches
 
 
 def get_project_count(team_id: str) -> int:
     """Get count of active projects for a team (for quota checking)."""
-    count = 0
-    for project in _projects.values():
-        if project["team_id"] == team_id and project["status"] != ProjectStatus.ARCHIVED.value:
-            count += 1
-    return count
+    return _active_project_count.get(team_id, 0)
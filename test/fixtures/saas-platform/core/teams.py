@@ -3,75 +3,99 @@ Team management for SaaS platform.
 Handles team creation, membership, and team settings.
 """
 
-from datetime import datetime
+from dataclasses import asdict
 from typing import Dict, Optional, Any, List
-import uuid
+
+from ..models import Team, field_names
+from ..utils import now_iso, uuid4_str
 
 
 # Storage
-_teams: Dict[str, Dict[str, Any]] = {}
+_teams: Dict[str, Team] = {}
 _team_members: Dict[str, List[Dict[str, Any]]] = {}  # team_id -> members
 _team_invitations: Dict[str, Dict[str, Any]] = {}
+_teams_by_slug: Dict[str, str] = {}  # slug -> team_id
+_teams_by_user: Dict[str, Dict[str, str]] = {}  # user_id -> {team_id: role}
+
+_TEAM_FIELDS = field_names(Team)
 
 
-def create_team(name: str, owner_id: str, slug: Optional[str] = None) -> Dict[str, Any]:
+def create_team(name: str, owner_id: str, slug: Optional[str] = None) -> Team:
     """Create a new team with the given user as owner."""
-    team_id = str(uuid.uuid4())
-
-    team = {
-        "id": team_id,
-        "name": name,
-        "slug": slug or name.lower().replace(" ", "-"),
-        "owner_id": owner_id,
-        "created_at": datetime.utcnow().isoformat(),
-        "settings": {},
-    }
+    slug = slug or name.lower().replace(" ", "-")
+    if slug in _teams_by_slug:
+        raise ValueError(f"Team slug {slug} is already taken")
+
+    team_id = uuid4_str()
+
+    team = Team(
+        id=team_id,
+        name=name,
+        slug=slug,
+        owner_id=owner_id,
+        created_at=now_iso(),
+    )
 
     _teams[team_id] = team
+    _teams_by_slug[slug] = team_id
     _team_members[team_id] = [{
         "user_id": owner_id,
         "role": "owner",
-        "joined_at": team["created_at"],
+        "joined_at": team.created_at,
     }]
+    _teams_by_user.setdefault(owner_id, {})[team_id] = "owner"
 
     return team
 
 
-def get_team(team_id: str) -> Optional[Dict[str, Any]]:
+def get_team(team_id: str) -> Optional[Team]:
     """Get a team by ID."""
     return _teams.get(team_id)
 
 
-def get_team_by_slug(slug: str) -> Optional[Dict[str, Any]]:
+def get_team_by_slug(slug: str) -> Optional[Team]:
     """Look up a team by its URL slug."""
-    for team in _teams.values():
-        if team["slug"] == slug:
-            return team
-    return None
+    team_id = _teams_by_slug.get(slug)
+    return _teams.get(team_id) if team_id else None
 
 
-def update_team(team_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def update_team(team_id: str, updates: Dict[str, Any]) -> Optional[Team]:
     """Update team details."""
     team = _teams.get(team_id)
     if not team:
         return None
 
     forbidden = {"id", "owner_id", "created_at"}
-    safe_updates = {k: v for k, v in updates.items() if k not in forbidden}
+    safe_updates = {
+        k: v for k, v in updates.items()
+        if k in _TEAM_FIELDS and k not in forbidden
+    }
+
+    new_slug = safe_updates.get("slug", team.slug)
+    if not new_slug:
+        raise ValueError("Team slug cannot be empty")
+    if new_slug != team.slug:
+        if new_slug in _teams_by_slug:
+            raise ValueError(f"Team slug {new_slug} is already taken")
+        del _teams_by_slug[team.slug]
+        _teams_by_slug[new_slug] = team_id
 
-    team.update(safe_updates)
-    team["updated_at"] = datetime.utcnow().isoformat()
+    for key, value in safe_updates.items():
+        setattr(team, key, value)
+    team.updated_at = now_iso()
 
     return team
 
 
 def delete_team(team_id: str) -> bool:
     """Delete a team and all associated data."""
-    if team_id not in _teams:
+    team = _teams.pop(team_id, None)
+    if not team:
         return False
 
-    del _teams[team_id]
-    _team_members.pop(team_id, None)
+    _teams_by_slug.pop(team.slug, None)
+    for member in _team_members.pop(team_id, []):
+        _teams_by_user.get(member["user_id"], {}).pop(team_id, None)
 
     # Remove invitations for this team
     to_remove = [k for k, v in _team_invitations.items() if v["team_id"] == team_id]
@@ -86,18 +110,17 @@ def add_team_member(team_id: str, user_id: str, role: str = "member") -> Dict[st
     if team_id not in _team_members:
         raise ValueError(f"Team {team_id} not found")
 
-    # Check if already a member
-    for member in _team_members[team_id]:
-        if member["user_id"] == user_id:
-            raise ValueError(f"User {user_id} is already a member")
+    if team_id in _teams_by_user.get(user_id, ()):
+        raise ValueError(f"User {user_id} is already a member")
 
     member = {
         "user_id": user_id,
         "role": role,
-        "joined_at": datetime.utcnow().isoformat(),
+        "joined_at": now_iso(),
     }
 
     _team_members[team_id].append(member)
+    _teams_by_user.setdefault(user_id, {})[team_id] = role
     return member
 
 
@@ -110,7 +133,10 @@ def remove_team_member(team_id: str, user_id: str) -> bool:
             # Can't remove owner
             if member["role"] == "owner":
                 raise ValueError("Cannot remove team owner")
-            members.pop(i)
+            # Member order is not significant: swap with the last and pop
+            members[i] = members[-1]
+            members.pop()
+            _teams_by_user.get(user_id, {}).pop(team_id, None)
             return True
 
     return False
@@ -124,25 +150,22 @@ def get_team_members(team_id: str) -> List[Dict[str, Any]]:
 def get_user_teams(user_id: str) -> List[Dict[str, Any]]:
     """Get all teams a user belongs to."""
     teams = []
-    for team_id, members in _team_members.items():
-        for member in members:
-            if member["user_id"] == user_id:
-                team = get_team(team_id)
-                if team:
-                    teams.append({**team, "role": member["role"]})
-                break
+    for team_id, role in _teams_by_user.get(user_id, {}).items():
+        team = get_team(team_id)
+        if team:
+            teams.append({**asdict(team), "role": role})
     return teams
 
 
 def create_invitation(team_id: str, email: str, role: str, invited_by: str) -> Dict[str, Any]:
     """Create an invitation to join a team."""
     invitation = {
-        "id": str(uuid.uuid4()),
+        "id": uuid4_str(),
         "team_id": team_id,
         "email": email,
         "role": role,
         "invited_by": invited_by,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": now_iso(),
         "expires_at": None,  # Set expiration in production
         "accepted_at": None,
     }
@@ -163,5 +186,5 @@ def accept_invitation(invitation_id: str, user_id: str) -> Dict[str, Any]:
     # Add user to team
     add_team_member(invitation["team_id"], user_id, invitation["role"])
 
-    invitation["accepted_at"] = datetime.utcnow().isoformat()
+    invitation["accepted_at"] = now_iso()
     return invitation
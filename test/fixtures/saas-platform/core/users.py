@@ -3,14 +3,22 @@ User management for SaaS platform.
 Handles user profiles, preferences, and account settings.
 """
 
-from datetime import datetime
 from typing import Dict, Optional, Any, List
-import uuid
+
+from ..models import User, field_names
+from ..utils import now_iso, SearchIndex, uuid4_str
 
 
 # User storage
-_users: Dict[str, Dict[str, Any]] = {}
+_users: Dict[str, User] = {}
 _user_preferences: Dict[str, Dict[str, Any]] = {}
+_users_by_email: Dict[str, str] = {}  # lowercased email -> user_id
+_user_search_index = SearchIndex()  # name + email, active users only
+_users_sanitized: Dict[str, Dict[str, Any]] = {}  # user_id -> public view, dropped on change
+
+_SENSITIVE_FIELDS = frozenset({"password_hash", "password_salt"})
+_PUBLIC_FIELDS = tuple(f for f in User.__slots__ if f not in _SENSITIVE_FIELDS)
+_USER_FIELDS = field_names(User)
 
 
 def create_user(
@@ -20,21 +28,24 @@ def create_user(
     password_salt: str
 ) -> Dict[str, Any]:
     """Create a new user account."""
-    user_id = str(uuid.uuid4())
-
-    user = {
-        "id": user_id,
-        "email": email,
-        "name": name,
-        "password_hash": password_hash,
-        "password_salt": password_salt,
-        "created_at": datetime.utcnow().isoformat(),
-        "last_login_at": None,
-        "is_active": True,
-        "email_verified": False,
-    }
+    email_key = email.lower()
+    if email_key in _users_by_email:
+        raise ValueError(f"User with email {email} already exists")
+
+    user_id = uuid4_str()
+
+    user = User(
+        id=user_id,
+        email=email,
+        name=name,
+        password_hash=password_hash,
+        password_salt=password_salt,
+        created_at=now_iso(),
+    )
 
     _users[user_id] = user
+    _users_by_email[email_key] = user_id
+    _user_search_index.set(user_id, name, email)
     return sanitize_user(user)
 
 
@@ -44,18 +55,19 @@ def get_user(user_id: str) -> Optional[Dict[str, Any]]:
     return sanitize_user(user) if user else None
 
 
-def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
+def get_user_by_email(email: str) -> Optional[User]:
     """Look up a user by email address."""
-    for user in _users.values():
-        if user["email"].lower() == email.lower():
-            return user  # Return full user for auth purposes
-    return None
+    user_id = _users_by_email.get(email.lower())
+    return _users.get(user_id) if user_id else None  # Full user for auth purposes
 
 
-def sanitize_user(user: Dict[str, Any]) -> Dict[str, Any]:
-    """Remove sensitive fields from user data."""
-    sensitive_fields = {"password_hash", "password_salt"}
-    return {k: v for k, v in user.items() if k not in sensitive_fields}
+def sanitize_user(user: User) -> Dict[str, Any]:
+    """Build a user dict without sensitive fields (from a view cached until the user changes)."""
+    view = _users_sanitized.get(user.id)
+    if view is None:
+        view = {name: getattr(user, name) for name in _PUBLIC_FIELDS}
+        _users_sanitized[user.id] = view
+    return view.copy()  # Callers get their own dict; the cached view stays intact
 
 
 def update_user(user_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -66,10 +78,28 @@ def update_user(user_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any
 
     # Prevent updating sensitive/system fields
     forbidden = {"id", "password_hash", "password_salt", "created_at"}
-    safe_updates = {k: v for k, v in updates.items() if k not in forbidden}
+    safe_updates = {
+        k: v for k, v in updates.items()
+        if k in _USER_FIELDS and k not in forbidden
+    }
 
-    user.update(safe_updates)
-    user["updated_at"] = datetime.utcnow().isoformat()
+    if "email" in safe_updates:
+        new_key = safe_updates["email"].lower()
+        old_key = user.email.lower()
+        if new_key != old_key:
+            if new_key in _users_by_email:
+                raise ValueError(f"User with email {safe_updates['email']} already exists")
+            del _users_by_email[old_key]
+            _users_by_email[new_key] = user_id
+
+    for key, value in safe_updates.items():
+        setattr(user, key, value)
+    user.updated_at = now_iso()
+    _users_sanitized.pop(user_id, None)
+    if not user.is_active:
+        _user_search_index.remove(user_id)
+    elif safe_updates.keys() & {"name", "email", "is_active"}:
+        _user_search_index.set(user_id, user.name, user.email)
 
     return sanitize_user(user)
 
@@ -80,8 +110,10 @@ def deactivate_user(user_id: str) -> bool:
     if not user:
         return False
 
-    user["is_active"] = False
-    user["deactivated_at"] = datetime.utcnow().isoformat()
+    user.is_active = False
+    user.deactivated_at = now_iso()
+    _users_sanitized.pop(user_id, None)
+    _user_search_index.remove(user_id)
     return True
 
 
@@ -91,8 +123,10 @@ def reactivate_user(user_id: str) -> bool:
     if not user:
         return False
 
-    user["is_active"] = True
-    user["reactivated_at"] = datetime.utcnow().isoformat()
+    user.is_active = True
+    user.reactivated_at = now_iso()
+    _users_sanitized.pop(user_id, None)
+    _user_search_index.set(user_id, user.name, user.email)
     return True
 
 
@@ -100,7 +134,8 @@ def record_login(user_id: str) -> None:
     """Record a successful login timestamp."""
     user = _users.get(user_id)
     if user:
-        user["last_login_at"] = datetime.utcnow().isoformat()
+        user.last_login_at = now_iso()
+        _users_sanitized.pop(user_id, None)
 
 
 def set_user_preferences(user_id: str, preferences: Dict[str, Any]) -> Dict[str, Any]:
@@ -125,15 +160,11 @@ def get_user_preferences(user_id: str) -> Dict[str, Any]:
 
 def search_users(query: str, limit: int = 20) -> List[Dict[str, Any]]:
     """Search users by name or email."""
-    query_lower = query.lower()
     matches = []
 
-    for user in _users.values():
-        if not user["is_active"]:
-            continue
-        if query_lower in user["name"].lower() or query_lower in user["email"].lower():
-            matches.append(sanitize_user(user))
-            if len(matches) >= limit:
-                break
+    for user_id in _user_search_index.search(query):
+        matches.append(sanitize_user(_users[user_id]))
+        if len(matches) >= limit:
+            break
 
     return matches
@@ -0,0 +1,88 @@
+"""
+Record types for SaaS platform storage.
+Slotted dataclasses for the high-volume entities (users, teams, projects,
+invoices, transactions) instead of one dict per record.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Any, FrozenSet
+
+
+@dataclass(slots=True)
+class User:
+    """A user account, including credential fields."""
+    id: str
+    email: str
+    name: str
+    password_hash: str = field(repr=False)
+    password_salt: str = field(repr=False)
+    created_at: str
+    last_login_at: Optional[str] = None
+    is_active: bool = True
+    email_verified: bool = False
+    updated_at: Optional[str] = None
+    deactivated_at: Optional[str] = None
+    reactivated_at: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Team:
+    """A team (tenant) that owns projects and billing."""
+    id: str
+    name: str
+    slug: str
+    owner_id: str
+    created_at: str
+    settings: Dict[str, Any] = field(default_factory=dict)
+    updated_at: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Project:
+    """A project within a team."""
+    id: str
+    team_id: str
+    name: str
+    status: str
+    created_at: str
+    description: Optional[str] = None
+    created_by: Optional[str] = None
+    settings: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    updated_at: Optional[str] = None
+    archived_at: Optional[str] = None
+    restored_at: Optional[str] = None
+    status_changed_at: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Invoice:
+    """An invoice issued to a team."""
+    id: str
+    team_id: str
+    amount_cents: int
+    description: str
+    created_at: str
+    line_items: List[Dict[str, Any]] = field(default_factory=list)
+    status: str = "open"
+    due_date: Optional[str] = None
+    paid_at: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Transaction:
+    """A payment (or refunded payment) against a team's payment method."""
+    id: str
+    team_id: str
+    amount_cents: int
+    payment_method_id: str
+    status: str
+    processed_at: str
+    invoice_id: Optional[str] = None
+    refunded_at: Optional[str] = None
+    refund_reason: Optional[str] = None
+
+
+def field_names(record_type: type) -> FrozenSet[str]:
+    """Names of all fields on a record type (for filtering update payloads)."""
+    return frozenset(f.name for f in fields(record_type))
@@ -0,0 +1,4 @@
+"""Shared helpers used across domains."""
+from .clock import now_iso
+from .search import SearchIndex
+from .ids import uuid4_str
@@ -0,0 +1,22 @@
+"""
+Timestamp helpers for SaaS platform.
+Provides cheap ISO-8601 timestamps for record bookkeeping fields.
+"""
+
+import time
+
+_last_second = -1
+_last_iso = ""
+
+
+def now_iso() -> str:
+    """
+    Return the current UTC time as an ISO-8601 string at one-second precision.
+    The formatted value is reused until the clock moves to the next second.
+    """
+    global _last_second, _last_iso
+    second = int(time.time())
+    if second != _last_second:
+        _last_second = second
+        _last_iso = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+    return _last_iso
@@ -0,0 +1,35 @@
+"""
+ID generation for SaaS platform.
+Hands out random UUIDs from a pooled block of secure random bytes.
+"""
+
+import os
+import secrets
+import uuid
+
+_POOL_UUIDS = 1024
+
+_pool = b""
+_offset = 0
+
+
+def _reset_pool() -> None:
+    """Discard pooled bytes (a forked child must not reuse the parent's IDs)."""
+    global _pool, _offset
+    _pool = b""
+    _offset = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def uuid4_str() -> str:
+    """Return a random version-4 UUID string without a urandom call per ID."""
+    global _pool, _offset
+    if _offset + 16 > len(_pool):
+        _pool = secrets.token_bytes(16 * _POOL_UUIDS)
+        _offset = 0
+    raw = _pool[_offset:_offset + 16]
+    _offset += 16
+    return str(uuid.UUID(bytes=raw, version=4))
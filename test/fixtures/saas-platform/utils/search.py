@@ -0,0 +1,62 @@
+"""
+Substring search index for SaaS platform records.
+Keeps lowercased search text per record and scans it as one joined string.
+"""
+
+import bisect
+from typing import Dict, Iterator, List, Optional
+
+_FIELD_SEP = "\0"
+_RECORD_SEP = "\x01"
+
+
+class SearchIndex:
+    """Lowercased search text per record id, searched with a single str.find scan."""
+
+    def __init__(self) -> None:
+        self._texts: Dict[str, str] = {}
+        self._blob = ""
+        self._ids: List[str] = []
+        self._starts: List[int] = []
+        self._stale = False
+
+    def set(self, record_id: str, *fields: Optional[str]) -> None:
+        """Index (or re-index) a record's searchable fields."""
+        self._texts[record_id] = _FIELD_SEP.join((f or "").lower() for f in fields)
+        self._stale = True
+
+    def remove(self, record_id: str) -> None:
+        """Drop a record from the index."""
+        if self._texts.pop(record_id, None) is not None:
+            self._stale = True
+
+    def _rebuild(self) -> None:
+        """Join all record texts into one blob with per-record start offsets."""
+        self._ids = list(self._texts)
+        self._starts = []
+        offset = 0
+        for text in self._texts.values():
+            self._starts.append(offset)
+            offset += len(text) + 1
+        self._blob = _RECORD_SEP.join(self._texts.values())
+        self._stale = False
+
+    def search(self, query: str) -> Iterator[str]:
+        """Yield ids of records whose text contains query, in insertion order."""
+        needle = query.lower()
+        if not needle:
+            yield from list(self._texts)
+            return
+        if _RECORD_SEP in needle or _FIELD_SEP in needle:
+            return
+        if self._stale:
+            self._rebuild()
+
+        blob, starts, ids = self._blob, self._starts, self._ids
+        pos = blob.find(needle)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            yield ids[i]
+            # Skip the rest of this record so each id is yielded once
+            next_start = starts[i + 1] if i + 1 < len(starts) else len(blob)
+            pos = blob.find(needle, next_start)
@@ -2,7 +2,7 @@
 
 import argparse
 from task import create_task, mark_complete
-from storage import load_tasks, save_tasks, find_task, delete_task
+from storage import load_tasks, save_tasks, save_tasks_many, find_task, delete_task
 from formatter import format_table, format_json, format_plain, format_summary
 from validators import validate_title
 
@@ -55,9 +55,7 @@ def add_task_cmd(title: str, priority: str):
         return
 
     task = create_task(title, priority)
-    tasks = load_tasks()
-    tasks.append(task.__dict__)
-    save_tasks(tasks)
+    save_tasks_many([task.to_dict()])
     print(f"Created task: {task.id}")
 
 
@@ -87,13 +85,9 @@ def complete_task_cmd(task_id: str):
         print(f"Task not found: {task_id}")
         return
 
+    # find_task returns the cached record, so mutate it in place
     task["completed"] = True
-    tasks = load_tasks()
-    for i, t in enumerate(tasks):
-        if t.get("id") == task_id:
-            tasks[i] = task
-            break
-    save_tasks(tasks)
+    save_tasks(load_tasks())
     print(f"Completed: {task['title']}")
 
 
@@ -3,25 +3,31 @@
 from typing import List
 import json as json_lib
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
+
+
+_TABLE_HEADER = "ID       | Priority | Status    | Title\n" + "-" * 60 + "\n"
+
 
 def format_table(tasks: List[dict]) -> str:
     """Format tasks as an ASCII table."""
     if not tasks:
         return "No tasks found."
 
-    lines = ["ID       | Priority | Status    | Title"]
-    lines.append("-" * 60)
-
-    for task in tasks:
-        status = "Done" if task.get("completed") else "Pending"
-        line = f"{task['id']:8} | {task['priority']:8} | {status:9} | {task['title'][:30]}"
-        lines.append(line)
-
-    return "\n".join(lines)
+    rows = "\n".join(
+        f"{t['id']:8} | {t['priority']:8} | {'Done' if t.get('completed') else 'Pending':9} | {t['title'][:30]}"
+        for t in tasks
+    )
+    return _TABLE_HEADER + rows
 
 
 def format_json(tasks: List[dict]) -> str:
     """Format tasks as JSON string."""
+    if orjson:
+        return orjson.dumps(tasks, option=orjson.OPT_INDENT_2).decode()
     return json_lib.dumps(tasks, indent=2)
 
 
@@ -41,6 +47,9 @@ def format_plain(tasks: List[dict]) -> str:
 def format_summary(tasks: List[dict]) -> str:
     """Format a summary of task counts."""
     total = len(tasks)
-    completed = sum(1 for t in tasks if t.get("completed"))
+    completed = 0
+    for t in tasks:
+        if t.get("completed"):
+            completed += 1
     pending = total - completed
     return f"Total: {total} | Completed: {completed} | Pending: {pending}"
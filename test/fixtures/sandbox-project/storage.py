@@ -1,34 +1,129 @@
 """JSON file persistence for tasks."""
 
+import atexit
 import json
+import mmap
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 from task import Task
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to stdlib json
+    orjson = None
+
 STORAGE_FILE = "tasks.json"
+LOG_FILE = "tasks.log"  # Append-only JSONL of tasks added since the last snapshot
+COMPACT_RATIO = 10  # Rewrite the snapshot once the log outgrows it by this factor
+
+# Tasks loaded once per process; changes are written back by flush_tasks()
+_tasks_cache: Optional[List[dict]] = None
+_tasks_by_id: Optional[Dict[str, dict]] = None  # Built on first find_task, reset by save_tasks
+_dirty = False
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes (or a buffer), using orjson when available."""
+    return orjson.loads(data) if orjson else json.loads(bytes(data))
+
+
+def _read_snapshot() -> List[dict]:
+    """Parse the snapshot file through a read-only memory map."""
+    with open(STORAGE_FILE, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _loads(view)
 
 
 def load_tasks() -> List[dict]:
-    """Load all tasks from storage file."""
-    if not os.path.exists(STORAGE_FILE):
-        return []
-    with open(STORAGE_FILE, "r") as f:
-        return json.load(f)
+    """Load all tasks, reading the snapshot and replaying the log on first access."""
+    global _tasks_cache
+    if _tasks_cache is None:
+        tasks = []
+        if os.path.exists(STORAGE_FILE):
+            tasks = _read_snapshot()
+        if os.path.exists(LOG_FILE):
+            # Skip ids already in the snapshot: a flush that died before
+            # removing the log leaves entries that were already compacted
+            seen = {t.get("id") for t in tasks}
+            with open(LOG_FILE, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        task = _loads(line)
+                        if task.get("id") not in seen:
+                            seen.add(task.get("id"))
+                            tasks.append(task)
+        _tasks_cache = tasks
+    return _tasks_cache
 
 
 def save_tasks(tasks: List[dict]) -> None:
-    """Save all tasks to storage file."""
-    with open(STORAGE_FILE, "w") as f:
-        json.dump(tasks, f, indent=2)
+    """Replace all stored tasks. Written to disk on flush_tasks()."""
+    global _tasks_cache, _tasks_by_id, _dirty
+    _tasks_cache = tasks
+    _tasks_by_id = None
+    _dirty = True
+
+
+def append_task(task: dict) -> None:
+    """Append a single task to the log without rewriting the snapshot."""
+    save_tasks_many([task])
+
+
+def save_tasks_many(new_tasks: List[dict]) -> None:
+    """Append several tasks to the log with a single write."""
+    global _dirty
+    load_tasks().extend(new_tasks)
+    if _tasks_by_id is not None:
+        for t in new_tasks:
+            _tasks_by_id.setdefault(t.get("id"), t)
+    if _dirty:
+        return  # A full snapshot is already pending and will include them
+
+    with open(LOG_FILE, "ab") as f:
+        f.write(b"".join(_dumps(t) + b"\n" for t in new_tasks))
+
+    snapshot_size = os.path.getsize(STORAGE_FILE) if os.path.exists(STORAGE_FILE) else 0
+    if os.path.getsize(LOG_FILE) > COMPACT_RATIO * max(snapshot_size, 1024):
+        _dirty = True
+
+
+def flush_tasks() -> None:
+    """Write pending task changes as a fresh snapshot and clear the log."""
+    global _dirty
+    if not _dirty:
+        return
+    # Write a temp file and swap it in, so a crash never leaves a partial snapshot
+    tmp_path = STORAGE_FILE + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps(_tasks_cache, pretty=True))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, STORAGE_FILE)
+    if os.path.exists(LOG_FILE):
+        os.remove(LOG_FILE)
+    _dirty = False
+
+
+atexit.register(flush_tasks)
 
 
 def find_task(task_id: str) -> Optional[dict]:
     """Find a task by its ID."""
-    tasks = load_tasks()
-    for task in tasks:
-        if task.get("id") == task_id:
-            return task
-    return None
+    global _tasks_by_id
+    if _tasks_by_id is None:
+        _tasks_by_id = {}
+        for task in load_tasks():
+            _tasks_by_id.setdefault(task.get("id"), task)
+    return _tasks_by_id.get(task_id)
 
 
 def delete_task(task_id: str) -> bool:
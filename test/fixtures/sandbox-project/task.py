@@ -1,25 +1,88 @@
 """Task model and core operations."""
 
-import uuid
-from datetime import datetime
-from validators import validate_priority, sanitize_input
+import os
+import time
+from array import array
+from typing import Iterable, List, NoReturn
+from validators import PRIORITY_MAP, PRIORITY_NAMES, sanitize_input, sanitize_input_batch
+
+# Second of the last rendered timestamp and its formatted "YYYY-MM-DDTHH:MM:SS" prefix
+_last_second = [None, ""]
+
+
+def _now_us() -> int:
+    """Current time as integer microseconds since the epoch."""
+    return time.time_ns() // 1000
+
+
+def _iso_from_us(us: int) -> str:
+    """Render epoch microseconds as local ISO 8601, formatting each second once."""
+    sec, frac = divmod(us, 1_000_000)
+    if sec != _last_second[0]:
+        _last_second[0] = sec
+        _last_second[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+    return f"{_last_second[1]}.{frac:06d}"
+
+
+def _raise_invalid_priority(priority: str) -> NoReturn:
+    """Cold path shared by every priority check."""
+    raise ValueError(f"Invalid priority: {priority}")
+
+
+def _priority_code(priority: str) -> int:
+    """Validate a priority and return its code, lowercasing only on a miss."""
+    code = PRIORITY_MAP.get(priority)
+    if code is None:
+        code = PRIORITY_MAP.get(priority.lower())
+        if code is None:
+            _raise_invalid_priority(priority)
+    return code
 
 
 class Task:
     """Represents a single task item."""
 
+    __slots__ = ("id", "title", "priority", "completed", "created_at")
+
     def __init__(self, title: str, priority: str = "medium"):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = os.urandom(4).hex()
         self.title = sanitize_input(title)
-        self.priority = priority.lower()
+        self.priority = _priority_code(priority)
         self.completed = False
-        self.created_at = datetime.now().isoformat()
+        self.created_at = _now_us()  # Epoch microseconds; see created_at_iso
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)  # str caches its own hash
+
+    @property
+    def created_at_iso(self) -> str:
+        """Creation time as a local ISO 8601 string."""
+        return _iso_from_us(self.created_at)
+
+    @property
+    def priority_name(self) -> str:
+        """Priority as its display name (low/medium/high)."""
+        return PRIORITY_NAMES[self.priority]
+
+    def to_dict(self) -> dict:
+        """Return the task as a plain dict for storage."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "priority": PRIORITY_NAMES[self.priority],
+            "completed": self.completed,
+            "created_at": _iso_from_us(self.created_at),
+        }
 
 
 def create_task(title: str, priority: str = "medium") -> Task:
     """Create a new task with validation."""
-    if not validate_priority(priority):
-        raise ValueError(f"Invalid priority: {priority}")
+    # Task validates the priority while resolving its code, in a single lookup
     return Task(title, priority)
 
 
@@ -31,7 +94,62 @@ def mark_complete(task: Task) -> Task:
 
 def update_priority(task: Task, new_priority: str) -> Task:
     """Update task priority with validation."""
-    if not validate_priority(new_priority):
-        raise ValueError(f"Invalid priority: {new_priority}")
-    task.priority = new_priority.lower()
+    task.priority = _priority_code(new_priority)
     return task
+
+
+class TaskBatch:
+    """Column-oriented task storage for bulk ingestion (one column per field)."""
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.titles: List[str] = []
+        self.priorities = array("B")
+        self.completed = bytearray()
+        self.created_at = array("q")  # Epoch microseconds
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, title: str, priority: str = "medium") -> int:
+        """Append a validated task and return its row index."""
+        code = _priority_code(priority)
+        title = sanitize_input(title)
+        self.ids.append(os.urandom(4).hex())
+        self.titles.append(title)
+        self.priorities.append(code)
+        self.completed.append(0)
+        self.created_at.append(_now_us())
+        return len(self.ids) - 1
+
+    def add_many(self, titles: List[str], priorities: List[str]) -> None:
+        """Append validated tasks in bulk, sanitizing all titles in one batch."""
+        if len(titles) != len(priorities):
+            raise ValueError("titles and priorities must have the same length")
+        # Validate and sanitize everything before touching a column, so bad
+        # input leaves the columns in sync
+        codes = [_priority_code(p) for p in priorities]
+        titles = sanitize_input_batch(titles)
+        now = _now_us()
+        self.ids.extend(os.urandom(4).hex() for _ in codes)
+        self.titles.extend(titles)
+        self.priorities.extend(codes)
+        self.completed.extend(bytes(len(codes)))
+        self.created_at.extend([now] * len(codes))
+
+    def mark_complete_all(self, mask: Iterable[bool]) -> None:
+        """Mark every row whose mask entry is true as completed."""
+        completed = self.completed
+        for i, flag in enumerate(mask):
+            if flag:
+                completed[i] = 1
+
+    def to_dicts(self) -> List[dict]:
+        """Return the rows as plain task dicts for storage."""
+        names = PRIORITY_NAMES
+        return [
+            {"id": i, "title": t, "priority": names[p], "completed": bool(c), "created_at": _iso_from_us(ts)}
+            for i, t, p, c, ts in zip(
+                self.ids, self.titles, self.priorities, self.completed, self.created_at
+            )
+        ]
@@ -1,19 +1,46 @@
 """Input validation helpers for task management."""
 
+from typing import List, Sequence
+
+# Priorities are stored as small int codes (index into PRIORITY_NAMES)
+PRIORITY_NAMES = ("low", "medium", "high")
+PRIORITY_MAP = {name: code for code, name in enumerate(PRIORITY_NAMES)}
+_VALID_PRIORITIES = frozenset(PRIORITY_MAP)
+
 
 def validate_title(title: str) -> bool:
     """Check if task title is valid (non-empty, max 100 chars)."""
-    if not title or not title.strip():
+    if not title:
         return False
-    return len(title.strip()) <= 100
+    if len(title) <= 100:
+        # Stripping can't make it longer; only all-whitespace titles fail
+        return not title.isspace()
+    return 0 < len(title.strip()) <= 100
 
 
 def validate_priority(priority: str) -> bool:
     """Check if priority is one of: low, medium, high."""
-    valid_priorities = ["low", "medium", "high"]
-    return priority.lower() in valid_priorities
+    if priority in _VALID_PRIORITIES:
+        return True
+    return priority.lower() in _VALID_PRIORITIES
+
+
+def validate_priority_codes(codes: Sequence[int]) -> bool:
+    """Check that every priority code in a batch (e.g. an array of bytes) is valid."""
+    return 0 <= min(codes, default=0) and max(codes, default=0) < len(PRIORITY_NAMES)
 
 
 def sanitize_input(text: str) -> str:
     """Remove dangerous characters from user input."""
+    # Chained replace beats both str.translate and re.sub here: each call is a
+    # memchr-backed scan that returns the same string when nothing matches
     return text.strip().replace("<", "").replace(">", "")
+
+
+def sanitize_input_batch(texts: List[str]) -> List[str]:
+    """Sanitize many inputs at once, same result as sanitize_input on each."""
+    # Strip each, then remove brackets from all of them in one joined string
+    out = "\0".join(map(str.strip, texts)).replace("<", "").replace(">", "").split("\0")
+    if len(out) != len(texts):  # Empty batch, or an input contained the separator
+        return [sanitize_input(t) for t in texts]
+    return out